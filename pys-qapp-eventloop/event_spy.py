@@ -0,0 +1,66 @@
+"""pys-qapp-eventloop"""
+
+import heapq
+import sys
+import time
+from datetime import datetime, timedelta
+from PySide6 import QtCore
+
+
+# -------------------------------------------------------------------------------------------------
+# EventSpy
+#
+# Event filter shared by the mental model examples. It records every QEvent::Timer delivered to the
+# objects it's installed on (or to everything, when installed on the application).
+#
+# Filtering should stay cheap, so only a monotonic timestamp and two names are recorded per event.
+# Formatting and printing is deferred to a once a second flush. The spy's own flush timer is
+# skipped so it doesn't log itself when installed app-wide.
+#
+# The spy also owns the example's slot output. Slots append (time.monotonic_ns(), text) to the
+# output list handed to the spy, and flush() merges both streams by timestamp so each Timer event
+# prints right before the slot it triggered, all in one write.
+#
+# A wall clock / monotonic pair is captured when the spy is created so the monotonic stamps can be
+# printed as wall time.
+#
+# The timer type and name are kept as plain module level values since they're checked per event.
+# -------------------------------------------------------------------------------------------------
+_TIMER_TYPE_INT = int(QtCore.QEvent.Timer)
+_TIMER_NAME = "Timer"
+
+
+class EventSpy(QtCore.QObject):
+  def __init__(self, output=None, parent=None):
+    super().__init__(parent)
+    self._output: list[tuple[int, str]] = output if output is not None else []
+    self._wall0 = datetime.now()
+    self._mono0 = time.monotonic_ns()
+    self._log: list[tuple[int, str, str]] = []
+    self._flush_timer = QtCore.QTimer(self)
+    self._flush_timer.timeout.connect(self.flush)
+    self._flush_timer.start(1000)
+
+  def eventFilter(self, watched, event):
+    # Returning False means "not filtered", the event continues on to its target as usual.
+    if int(event.type()) != _TIMER_TYPE_INT or watched is self._flush_timer:
+      return False
+    self._log.append((time.monotonic_ns(), watched.__class__.__name__, _TIMER_NAME))
+    return False
+
+  @QtCore.Slot()
+  def flush(self):
+    if not self._log and not self._output:
+      return
+    events = [(ts, f"Event={evt_name}, Target={tgt_name}") for ts, tgt_name, evt_name in self._log]
+    lines = [f"[{self.wall_time(ts)}] {text}" for ts, text in heapq.merge(events, self._output)]
+    self._log.clear()
+    self._output.clear()
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+  def wall_time(self, ts: int) -> datetime:
+    """
+    Convert a time.monotonic_ns() stamp into wall time using the anchor taken at construction.
+    """
+    return self._wall0 + timedelta(microseconds=(ts - self._mono0) // 1000)
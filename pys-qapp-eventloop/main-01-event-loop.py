@@ -32,11 +32,15 @@ from PySide6 import QtCore
 #
 # - I'll use a small payload to identify some attribute level data. This will be a simple string
 #   that will get printed later as part of it being received by the target (QObject) as an event.
+#
+# - Only we construct MyEvent, so the receiver checks the Python class to identify it. That skips
+#   the event.type() call through the binding.
 # -------------------------------------------------------------------------------------------------
 class MyEvent(QtCore.QEvent):
+  # No __slots__: Shiboken types always give instances a __dict__, so it wouldn't save anything
   Type = QtCore.QEvent.Type(QtCore.QEvent.registerEventType())
-  def __init__(self, payload):
-    super().__init__(MyEvent.Type)
+  def __init__(self, payload, _type=Type):
+    super().__init__(_type)
     self.payload = payload
 
 
@@ -60,7 +64,7 @@ class Receiver(QtCore.QObject):
     mapp.aboutToQuit.connect(self.callback)
 
   def event(self, event):
-    if event.type() == MyEvent.Type:
+    if type(event) is MyEvent:
       print(f"[recv] Received MyEvent with payload: '{event.payload}'")
       QtCore.QCoreApplication.quit()   # Stop event loop after handling
       return True
@@ -5,57 +5,75 @@
 import signal
 import argparse
 import sys
+import threading
 import time
-from datetime import datetime
 from PySide6 import QtCore, QtGui, QtWidgets
+from event_spy import EventSpy
 
 
 # Rewrite main1.py as a class just to exercise/reinforce our understand 
 
-class MyApplicationEventSpy(QtCore.QObject):
-  def eventFilter(self, watched, event):
-    etype = event.type()
-    if etype == QtCore.QEvent.Timer:
-      evt_name = etype.name
-      tgt_name = watched.__class__.__name__
-      print(f"[{datetime.now()}] Event={evt_name}, Target={tgt_name}")
-    return super().eventFilter(watched, event)
+# Timer slots append (timestamp, line) here instead of printing, the spy writes it out with its log.
+_buf: list[tuple[int, str]] = []
 
 
 class MyApplicationTimers(QtCore.QObject):
   def __init__(self, parent=None):
     super().__init__(parent)
-    self.timer1 = QtCore.QTimer(self)
-    self.timer2 = QtCore.QTimer(self)
-    self.timer1.timeout.connect(self.timer_1000ms)
-    self.timer2.timeout.connect(self.timer_0250ms)
-    self.timer1.start(1000)
-    self.timer2.start(250)
+    # Register a single 250ms timer on this object directly. Each tick arrives as a QTimerEvent
+    # delivered to timerEvent() rather than going through a QTimer and its timeout signal. Every
+    # fourth tick doubles as the 1000ms tick.
+    self._tick = 0
+    self._id = self.startTimer(250)
+
+  def timerEvent(self, ev):
+    if ev.timerId() != self._id:
+      return super().timerEvent(ev)
+    self._tick = (self._tick + 1) & 3
+    self.timer_0250ms()
+    if self._tick == 0:
+      self.timer_1000ms()
 
   @QtCore.Slot()
   def timer_1000ms(self):
-    print(f"[{datetime.now()}] (1000ms) TIMER SLOT: timer_1000ms()")
+    _buf.append((time.monotonic_ns(), "(1000ms) TIMER SLOT: timer_1000ms()"))
 
   @QtCore.Slot()
   def timer_0250ms(self):
-    print(f"[{datetime.now()}] (0250ms) TIMER SLOT: timer_0250ms()")
+    _buf.append((time.monotonic_ns(), "(0250ms) TIMER SLOT: timer_0250ms()"))
 
 
 def main():
-  app = QtCore.QCoreApplication(sys.argv)
-  spy = MyApplicationEventSpy()
+  # Reuse an existing application (e.g. main() called repeatedly from a harness) if there is one.
+  # Everything this run creates is parented to `run` so it can all be torn down after the loop
+  # exits, leaving the shared app as it was found.
+  app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication(sys.argv)
+  run = QtCore.QObject(app)
+  spy = EventSpy(_buf, run)
   app.installEventFilter(spy)
 
-  timers = MyApplicationTimers(app) # good practice so ownership is clearly communicated
+  timers = MyApplicationTimers(run) # good practice so ownership is clearly communicated
+
+  # Drain whatever output is left on the way out.
+  app.aboutToQuit.connect(spy.flush)
 
   def handle_sigint(signum, frame):
     print("SIGINT received by Python signal handler: ", signum)
     app.quit()
 
-  signal.signal(signal.SIGINT, handle_sigint)
+  # Python only allows installing signal handlers from the main thread
+  if threading.current_thread() is threading.main_thread():
+    signal.signal(signal.SIGINT, handle_sigint)
 
-  sys.exit(app.exec())
+  try:
+    code = app.exec()
+  finally:
+    app.aboutToQuit.disconnect(spy.flush)
+    app.removeEventFilter(spy)
+    run.deleteLater()
+    QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+  return code
 
 
 if __name__ == "__main__":
-  main()
+  sys.exit(main())
@@ -4,10 +4,13 @@
 
 import signal
 import argparse
+import functools
 import sys
+import threading
 import time
 from datetime import datetime
 from PySide6 import QtCore, QtGui, QtWidgets
+from event_spy import EventSpy
 
 
 # -------------------------------------------------------------------------------------------------
@@ -35,16 +38,20 @@ from PySide6 import QtCore, QtGui, QtWidgets
 # EventSpy
 #
 # To observe Qt’s event flow, I can create an event filter and install it on a specific QObject.
-# Since I have two timers I don't want to install twice so I'll just install on our QApplication.
+# I only care about the two timers, so I install it on each of them rather than on the whole
+# application. Installed app-wide, every event Qt dispatches (input, paint, layout, ...) would
+# cross into Python just to be ignored.
+#
+# The spy itself lives in event_spy.py so both mental model examples share one implementation.
 # -------------------------------------------------------------------------------------------------
-class EventSpy(QtCore.QObject):
-  def eventFilter(self, watched, event):
-    etype = event.type()
-    if etype == QtCore.QEvent.Timer:
-      evt_name = etype.name
-      tgt_name = watched.__class__.__name__
-      print(f"[{datetime.now()}] Event={evt_name}, Target={tgt_name}")
-    return super().eventFilter(watched, event)
+
+
+# -------------------------------------------------------------------------------------------------
+# Output buffer
+# The timer slots append (timestamp, line) here instead of printing. The spy writes it out together
+# with its own log once a second, plus a final flush when the application is about to quit.
+# -------------------------------------------------------------------------------------------------
+_buf: list[tuple[int, str]] = []
 
 
 # -------------------------------------------------------------------------------------------------
@@ -52,7 +59,7 @@ class EventSpy(QtCore.QObject):
 # Typical slot to show the end-to-end behavior.
 # -------------------------------------------------------------------------------------------------
 def print_time_1000ms():
-  print(f"[{datetime.now()}] (1000ms) TIMER SLOT: print_time_1000ms()")
+  _buf.append((time.monotonic_ns(), "(1000ms) TIMER SLOT: print_time_1000ms()"))
 
 
 # -------------------------------------------------------------------------------------------------
@@ -60,7 +67,7 @@ def print_time_1000ms():
 # Typical slot to show the end-to-end behavior.
 # -------------------------------------------------------------------------------------------------
 def print_time_0250ms():
-  print(f"[{datetime.now()}] (0250ms) TIMER SLOT: print_time_0250ms()")
+  _buf.append((time.monotonic_ns(), "(0250ms) TIMER SLOT: print_time_0250ms()"))
 
 
 # -------------------------------------------------------------------------------------------------
@@ -74,23 +81,85 @@ def bad_print_time():
   print(f"[{datetime.now()}] TIMER SLOT: leaving print_time()")
 
 
+# -------------------------------------------------------------------------------------------------
+# Offload demo
+# Set to True to have main() run offloaded_print_time once at startup.
+# -------------------------------------------------------------------------------------------------
+OFFLOAD_DEMO = False
+
+
+# -------------------------------------------------------------------------------------------------
+# SleepJobReceiver
+# main() creates this parented to the app so it lives in the main thread. SleepJob reports back via
+# a queued call, so done() executes inside the event loop instead of on the worker thread.
+# -------------------------------------------------------------------------------------------------
+class SleepJobReceiver(QtCore.QObject):
+  @QtCore.Slot()
+  def done(self):
+    _buf.append((time.monotonic_ns(), "(offload) SleepJob finished"))
+
+
+# -------------------------------------------------------------------------------------------------
+# SleepJob
+# The same 5 second block as bad_print_time, but run on a QThreadPool worker. When the work is done
+# it asks the receiver to run its done() slot.
+# -------------------------------------------------------------------------------------------------
+class SleepJob(QtCore.QRunnable):
+  def __init__(self, receiver):
+    super().__init__()
+    self.receiver = receiver
+
+  def run(self):
+    time.sleep(5)
+    QtCore.QMetaObject.invokeMethod(self.receiver, "done", QtCore.Qt.QueuedConnection)
+
+
+# -------------------------------------------------------------------------------------------------
+# Slot (callback)
+# Opt-in counterpart to bad_print_time. The sleep happens on a worker so this returns right away
+# and the event loop keeps dispatching (timers keep firing on schedule). The receiver is bound in
+# when main() connects it.
+# -------------------------------------------------------------------------------------------------
+def offloaded_print_time(receiver):
+  _buf.append((time.monotonic_ns(), "(offload) TIMER SLOT: entering offloaded_print_time()"))
+  QtCore.QThreadPool.globalInstance().start(SleepJob(receiver))
+  _buf.append((time.monotonic_ns(), "(offload) TIMER SLOT: leaving offloaded_print_time()"))
+
+
 # -------------------------------------------------------------------------------------------------
 # Main application entry point
 # -------------------------------------------------------------------------------------------------
 def main():
-  app = QtCore.QCoreApplication(sys.argv)
-  spy = EventSpy()
-  app.installEventFilter(spy)
+  # Reuse an existing application (e.g. main() called repeatedly from a harness) if there is one.
+  # Everything this run creates is parented to `run` so it can all be torn down after the loop
+  # exits, leaving the shared app as it was found.
+  app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication(sys.argv)
+  run = QtCore.QObject(app)
+  spy = EventSpy(_buf, run)
 
   # Connect timeout signal to slot and register repeating timers with the event loop.
-  timer1 = QtCore.QTimer()
+  timer1 = QtCore.QTimer(run)
   timer1.timeout.connect(print_time_1000ms)
   timer1.start(1000)  # Register a 1000 ms repeating timer.
 
-  timer2 = QtCore.QTimer()
+  timer2 = QtCore.QTimer(run)
   timer2.timeout.connect(print_time_0250ms)
   timer2.start(250)   # Register a 250 ms repeating timer.
 
+  # Spy on just the two timers.
+  timer1.installEventFilter(spy)
+  timer2.installEventFilter(spy)
+
+  # Opt-in: start one offloaded 5 second job as the loop starts and watch the timers keep firing.
+  # The receiver is parented to the app rather than `run` (and reused across runs) so a job still
+  # sleeping when a run ends has somewhere to report back to.
+  if OFFLOAD_DEMO:
+    receiver = app.findChild(SleepJobReceiver) or SleepJobReceiver(app)
+    QtCore.QTimer.singleShot(0, functools.partial(offloaded_print_time, receiver))
+
+  # Drain whatever output is left on the way out.
+  app.aboutToQuit.connect(spy.flush)
+
   # Ctrl-C sends SIGINT. Python receives SIGINT, but Qt's C++ event loop will not automatically
   # stop just because the signal arrived. I install a SIGINT handler that explicitly asks the
   # Qt event loop to quit, so Ctrl-C cleanly exits this program.
@@ -98,12 +167,20 @@ def main():
     print("SIGINT received in Python signal handler:", signum)
     app.quit()
 
-  signal.signal(signal.SIGINT, handle_sigint)
+  # Python only allows installing signal handlers from the main thread
+  if threading.current_thread() is threading.main_thread():
+    signal.signal(signal.SIGINT, handle_sigint)
 
-  # Start the Qt event loop and ensure the event loop's exit code is returned to the shell.
-  sys.exit(app.exec())
+  # Start the Qt event loop and return its exit code (the __main__ block hands it to the shell).
+  try:
+    code = app.exec()
+  finally:
+    app.aboutToQuit.disconnect(spy.flush)
+    run.deleteLater()
+    QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+  return code
 
 
 if __name__ == "__main__":
-  main()
+  sys.exit(main())
 
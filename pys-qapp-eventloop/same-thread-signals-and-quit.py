@@ -19,7 +19,8 @@ from PySide6 import QtCore
 #
 # 3. QTimer.singleShot(0, ...) is the idiomatic way to schedule startup work inside the event loop,
 #    ensuring that initialization occurs after the loop is running. This seemed to be an idiomatic
-#    pattern used quite often from online systems.
+#    pattern used quite often from online systems. A leaner equivalent is a queued
+#    QMetaObject.invokeMethod, which posts a single meta-call event without creating a QTimer.
 #
 # These behaviors are fundamental to understanding how Qt dispatches events, signals, and shutdown
 # requests.
@@ -34,8 +35,17 @@ class Foo(QtCore.QObject):
   signal2 = QtCore.Signal()
   finished = QtCore.Signal()
 
+  # -----------------------------------------------------------------------------------------------
+  # When True, do_stuff calls slot1/slot2 straight from a pre-built tuple instead of emitting. For
+  # same-thread direct connections the result is identical but skips Qt's connection list walk.
+  # Leave False whenever a receiver could live in another thread, only emit() queues across threads.
+  # -----------------------------------------------------------------------------------------------
+  DIRECT_SLOTS = False
+
   def __init__(self, parent=None):
     super().__init__(parent)
+    self._signal1_slots = (self.slot1,)
+    self._signal2_slots = (self.slot2,)
 
   # -----------------------------------------------------------------------------------------------
   # This function emits three signals in sequence. Because all objects live in the same thread,
@@ -44,7 +54,11 @@ class Foo(QtCore.QObject):
   # -----------------------------------------------------------------------------------------------
   def do_stuff(self):
     print("Emit signal one")
-    self.signal1.emit()   # slot1 executes immediately (direct connection)
+    if self.DIRECT_SLOTS:
+      for s in self._signal1_slots:
+        s()
+    else:
+      self.signal1.emit()   # slot1 executes immediately (direct connection)
 
     # here's the crux of what i'm trying to understand. I now know that app.quit won't actually 
     # quit until after this event handler do_stuff returns.
@@ -52,7 +66,11 @@ class Foo(QtCore.QObject):
     self.finished.emit()  # app.quit() is invoked, but it only requests exit after this handler ends
 
     print("Emit signal two")
-    self.signal2.emit()   # slot2 executes immediately (direct connection)
+    if self.DIRECT_SLOTS:
+      for s in self._signal2_slots:
+        s()
+    else:
+      self.signal2.emit()   # slot2 executes immediately (direct connection)
 
   # -----------------------------------------------------------------------------------------------
   # Slots that react to signal1 and signal2.
@@ -66,8 +84,9 @@ class Foo(QtCore.QObject):
     print("Execute slot two")
 
   # -----------------------------------------------------------------------------------------------
-  # This method is scheduled using QTimer.singleShot(0, ...). It executes once the event loop is
-  # running, guaranteeing that all work happens inside the event delivery system.
+  # This method is scheduled using a queued QMetaObject.invokeMethod. It executes once the event
+  # loop is running, guaranteeing that all work happens inside the event delivery system. It must
+  # stay a declared Slot so invokeMethod can find it by name.
   # -----------------------------------------------------------------------------------------------
   @QtCore.Slot()
   def start(self):
@@ -84,6 +103,7 @@ def main():
 
   # Because sender and receiver live in the same thread, Qt uses direct connections. Slots run
   # immediately and synchronously when signals are emitted.
+  # With Foo.DIRECT_SLOTS enabled these connections are bypassed in favour of the slot tuples.
   foo.signal1.connect(foo.slot1)
   foo.signal2.connect(foo.slot2)
 
@@ -91,9 +111,10 @@ def main():
   # handler returns. It does NOT interrupt active functions.
   foo.finished.connect(app.quit)
 
-  # Schedule startup work to run after the event loop begins. This is the recommended Qt pattern
-  # for deferring initialization until the event system is active.
-  QtCore.QTimer.singleShot(0, foo.start)
+  # Schedule startup work to run after the event loop begins. Same effect as
+  # QTimer.singleShot(0, foo.start) but only a QMetaCallEvent is posted, no QTimer is created,
+  # fired and torn down.
+  QtCore.QMetaObject.invokeMethod(foo, "start", QtCore.Qt.QueuedConnection)
 
   # Enter the Qt event loop. It runs until app.quit() is requested and control returns to the
   # dispatcher.